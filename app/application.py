@@ -4,22 +4,42 @@ System tray application orchestrating UI, monitoring, and notifications.
 from __future__ import annotations
 
 import threading
-import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import pystray
 from pystray import Menu
 from smartcard.System import readers
 
+try:
+    from smartcard.scard import (
+        INFINITE,
+        SCARD_E_CANCELLED,
+        SCARD_S_SUCCESS,
+        SCARD_SCOPE_USER,
+        SCARD_STATE_CHANGED,
+        SCARD_STATE_UNAWARE,
+        SCardCancel,
+        SCardEstablishContext,
+        SCardGetStatusChange,
+        SCardReleaseContext,
+    )
+    _HAS_SCARD_EVENTS = True
+except Exception:  # pragma: no cover - depends on the PC/SC stack present
+    _HAS_SCARD_EVENTS = False
+
 from version import APP_NAME, APP_DESC, VERSION, AUTHOR
 from .nfc.observer import UIDObserver
 from .ui.icons import draw_icon_connected, draw_icon_disconnected
-from .ui.menu import build_menu
+from .ui.menu import iter_menu_items
 from .ui.notifier import Notifier
+from .ui.tray_icon import TrayIcon, load_hicon
 from .utils.clipboard import copy_text
 from .utils.logging import safe_log
 
+# Pseudo-reader that makes SCardGetStatusChange wake on reader plug/unplug.
+_PNP_NOTIFICATION = "\\\\?PnP?\\Notification"
+
 
 class TrayApplication:
     """Main application managing the tray icon and smart card monitoring."""
@@ -28,33 +48,91 @@ class TrayApplication:
         self._icon_connected = draw_icon_connected()
         self._icon_disconnected = draw_icon_disconnected()
 
-        self.icon = pystray.Icon(
+        self.icon = TrayIcon(
             APP_NAME,
             icon=self._icon_disconnected,
             title=f"{APP_NAME} — {APP_DESC}\nVersão {VERSION} — {AUTHOR}",
+            menu=Menu(self._menu_items),  # dynamic: items generated on show
         )
 
-        self.history = deque(maxlen=10)
+        # Pre-built native handles; None when unavailable (non-Windows).
+        self._hicon_connected = load_hicon(self._icon_connected)
+        self._hicon_disconnected = load_hicon(self._icon_disconnected)
+        self._current_connected: Optional[bool] = None
+
+        # Insertion-ordered set of UIDs (oldest → newest), capped at 10;
+        # dict gives O(1) dedup/move-to-end instead of deque scans.
+        self.history: dict[str, None] = {}
         self.reader_name: Optional[str] = None
+        self._last_connected: Optional[bool] = None
+        self._last_name: Optional[str] = None
+        self._scard_ctx = None
 
-        self.notifier = Notifier(self.icon)
+        self.notifier = Notifier(
+            balloon_notify=lambda body, title: self.icon.notify(body, title=title)
+        )
+        # Clipboard copies get their own worker: the notifier's worker
+        # blocks for the duration of each toast, which would delay copies.
+        self._clip_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Clipboard")
         self.is_startup_notified = False
 
         self._stop_event = threading.Event()
         self._monitor_lock = threading.Lock()
+        # Cross-thread UI updates are posted here and applied by the UI pump
+        # thread; deque append/popleft are atomic under the GIL, so no lock.
+        self._ui_queue: deque = deque()
+        self._ui_wake = threading.Event()
+        self._menu_dirty = False
+        self._last_menu_key: Optional[tuple] = None
         self._card_monitor = None
         self._observer: Optional[UIDObserver] = None
 
-        self._rebuild_menu()  # initial menu
-
     # -------------------------- public API ---------------------------------
     def run(self) -> None:
         """Run the tray icon loop and start background monitoring."""
         safe_log("=== Starting NFCopy ===")
         threading.Thread(target=self._monitor_loop, name="SCMonitor", daemon=True).start()
-        self.icon.run()
+        self.icon.run(setup=self._start_ui_pump)
         safe_log("=== Exiting NFCopy ===")
 
+    # ----------------------------- UI pump ---------------------------------
+    def _start_ui_pump(self, icon) -> None:
+        icon.visible = True
+        threading.Thread(target=self._ui_pump, name="UIPump", daemon=True).start()
+
+    def _post_ui(self, *message) -> None:
+        """Queue a UI mutation to be applied by the UI pump thread."""
+        self._ui_queue.append(message)
+        self._ui_wake.set()
+
+    def _mark_menu_dirty(self) -> None:
+        """Request a (debounced) menu rebuild on the next UI-pump tick."""
+        self._menu_dirty = True
+        self._ui_wake.set()
+
+    def _ui_pump(self) -> None:
+        """Drain queued UI messages, coalescing bursts into one update each."""
+        while not self._stop_event.is_set():
+            self._ui_wake.wait()
+            self._ui_wake.clear()
+
+            icon_state: Optional[bool] = None
+            while True:
+                try:
+                    message = self._ui_queue.popleft()
+                except IndexError:
+                    break
+                if message[0] == "icon":
+                    icon_state = message[1]
+
+            if icon_state is not None:
+                self._set_icon_connected(icon_state)
+            if self._menu_dirty:
+                # Reset before building so a concurrent setter re-arms the
+                # wake event instead of being swallowed by this rebuild.
+                self._menu_dirty = False
+                self._rebuild_menu()
+
     # ------------------------- event handlers ------------------------------
     def _on_uid(self, uid: str) -> None:
         """
@@ -65,59 +143,124 @@ class TrayApplication:
         - append UID to the end (most recent)
         - keep at most 10 entries
         """
+        # Copy on the clipboard worker while we update history, then await
+        # it so menu state is only published with the UID already copied.
         try:
-            copy_text(uid)
-        except Exception as exc:
-            safe_log(f"[App] Clipboard copy failed: {exc}")
+            copy_future = self._clip_pool.submit(copy_text, uid)
+        except RuntimeError:
+            copy_future = None  # pool shut down
 
-        try:
-            if uid in self.history:
-                self.history.remove(uid)
-        except ValueError:
-            pass
-        self.history.append(uid)
+        # Trim before inserting so the dict never exceeds 10 entries, even
+        # observed mid-update from the menu-render thread.
+        self.history.pop(uid, None)
+        while len(self.history) >= 10:
+            self.history.pop(next(iter(self.history)))
+        self.history[uid] = None
+
+        self.notifier.show_uid_toast(uid)
+
+        if copy_future is not None:
+            try:
+                copy_future.result(timeout=0.5)
+            except Exception as exc:
+                safe_log(f"[App] Async clipboard copy stalled, copying inline: {exc}")
+                copy_text(uid)
+        else:
+            copy_text(uid)
 
-        self._rebuild_menu()
-        self.notifier.uid_copied(uid)
+        self._mark_menu_dirty()
 
     # --------------------- reader monitoring loop --------------------------
     def _monitor_loop(self) -> None:
-        last_connected: Optional[bool] = None
-        last_name: Optional[str] = None
+        if _HAS_SCARD_EVENTS and self._establish_scard_context():
+            try:
+                self._event_monitor_loop()
+            finally:
+                self._release_scard_context()
+        else:
+            self._poll_monitor_loop()
+
+    def _event_monitor_loop(self) -> None:
+        """Block inside SCardGetStatusChange until the reader list changes."""
+        pnp_state = SCARD_STATE_UNAWARE
         while not self._stop_event.is_set():
+            self._sync_reader_state()
             try:
-                rlist = readers()
+                hresult, states = SCardGetStatusChange(
+                    self._scard_ctx, INFINITE, [(_PNP_NOTIFICATION, pnp_state)]
+                )
             except Exception as exc:
-                safe_log(f"[App] Error listing readers: {exc}")
-                rlist = []
+                safe_log(f"[App] SCardGetStatusChange failed: {exc}")
+                self._stop_event.wait(1.0)
+                continue
+            if self._stop_event.is_set():
+                break
+            if hresult == SCARD_E_CANCELLED:
+                break  # SCardCancel from the exit handler
+            if hresult != SCARD_S_SUCCESS:
+                # Context lost or transient failure; back off and retry.
+                self._stop_event.wait(1.0)
+                continue
+            if states:
+                _name, event_state, _atr = states[0]
+                pnp_state = event_state & ~SCARD_STATE_CHANGED
 
-            connected = len(rlist) > 0
-            name = str(rlist[0]) if connected else None
+    def _poll_monitor_loop(self) -> None:
+        """Fallback when the low-level PC/SC API is unavailable."""
+        while not self._stop_event.is_set():
+            self._sync_reader_state()
+            self._stop_event.wait(1.0)
 
-            if connected != last_connected or name != last_name:
-                self.reader_name = name
-                self.notifier.nfc_reader_state(name, last_name, connected)
-                self._set_icon_connected(connected)
-                self._rebuild_menu()
-                last_connected, last_name = connected, name
+    def _sync_reader_state(self) -> None:
+        try:
+            rlist = readers()
+        except Exception as exc:
+            safe_log(f"[App] Error listing readers: {exc}")
+            rlist = []
 
-            if connected:
-                self._ensure_card_monitor_started()
-            else:
-                self._ensure_card_monitor_stopped()
+        connected = len(rlist) > 0
+        name = str(rlist[0]) if connected else None
 
-            if not self.is_startup_notified:
-                self.notifier.nfc_reader_state(name, last_name, connected)
-                self.is_startup_notified = True
+        changed = connected != self._last_connected or name != self._last_name
+        if changed:
+            self.reader_name = name
+            self._post_ui("icon", connected)
+            self._mark_menu_dirty()
 
-            for _ in range(10):
-                if self._stop_event.is_set():
-                    break
-                time.sleep(0.1)
+        # One toast covers both the first pass and any later transition.
+        if changed or not self.is_startup_notified:
+            self.notifier.show_nfc_reader_state_toast(name, self._last_name, connected)
 
-        self._ensure_card_monitor_stopped()
+        if changed:
+            self._last_connected, self._last_name = connected, name
+        self.is_startup_notified = True
+
+        if connected:
+            self._ensure_card_monitor_started()
+
+    def _establish_scard_context(self) -> bool:
+        try:
+            hresult, ctx = SCardEstablishContext(SCARD_SCOPE_USER)
+        except Exception as exc:
+            safe_log(f"[App] PC/SC context unavailable: {exc}")
+            return False
+        if hresult != SCARD_S_SUCCESS:
+            safe_log(f"[App] SCardEstablishContext failed: 0x{hresult & 0xFFFFFFFF:08X}")
+            return False
+        self._scard_ctx = ctx
+        return True
+
+    def _release_scard_context(self) -> None:
+        ctx, self._scard_ctx = self._scard_ctx, None
+        if ctx is not None:
+            try:
+                SCardReleaseContext(ctx)
+            except Exception:
+                pass
 
     def _ensure_card_monitor_started(self) -> None:
+        """Lazily start the card monitor once; it stays attached for the
+        app lifetime and simply receives no events while no reader exists."""
         from smartcard.CardMonitoring import CardMonitor
 
         with self._monitor_lock:
@@ -130,11 +273,13 @@ class TrayApplication:
                 except Exception as exc:
                     safe_log(f"[App] Failed to start CardMonitor: {exc}")
 
-    def _ensure_card_monitor_stopped(self) -> None:
+    def _shutdown_card_monitor(self) -> None:
         with self._monitor_lock:
             try:
                 if self._card_monitor and self._observer:
                     self._card_monitor.deleteObserver(self._observer)
+                if self._observer:
+                    self._observer.close()
             except Exception:
                 pass
             finally:
@@ -150,26 +295,42 @@ class TrayApplication:
         )
 
     def _set_icon_connected(self, connected: bool) -> None:
+        if connected == self._current_connected:
+            return  # already showing this state
         try:
-            self.icon.icon = self._icon_connected if connected else self._icon_disconnected
+            hicon = self._hicon_connected if connected else self._hicon_disconnected
+            if hicon is not None and hasattr(self.icon, "set_icon_handle"):
+                self.icon.set_icon_handle(hicon)
+            else:
+                self.icon.icon = self._icon_connected if connected else self._icon_disconnected
+            self._current_connected = connected
         except Exception as exc:
             safe_log(f"[App] Failed to switch icon: {exc}")
 
+    def _menu_items(self):
+        """Source of the dynamic tray menu; called by pystray on show."""
+        return iter_menu_items(
+            self._reader_status_label(),
+            tuple(self.history),        # snapshot; history mutates off-thread
+            self._on_click_copy_uid,    # callback
+            self._on_click_exit,
+        )
+
     def _rebuild_menu(self) -> None:
+        """Ask pystray to re-render the dynamic menu if its content changed."""
         try:
-            menu: Menu = build_menu(
-                self._reader_status_label(),
-                self.history,               # iterable deque (oldest → newest)
-                self._on_click_copy_uid,    # callback
-                self._on_click_exit,
-            )
-            self.icon.menu = menu
+            # Refreshing closes an open menu on Windows; skip when nothing
+            # the menu displays has actually changed.
+            key = (self._reader_status_label(), tuple(self.history))
+            if key == self._last_menu_key:
+                return
             try:
                 self.icon.update_menu()
             except Exception:
                 pass
+            self._last_menu_key = key
         except Exception as exc:
-            safe_log(f"[App] Failed to rebuild menu: {exc}")
+            safe_log(f"[App] Failed to refresh menu: {exc}")
 
     # menu actions -----------------------------------------------------------
     def _on_click_copy_uid(self, uid: str, icon=None, item=None) -> None:
@@ -178,14 +339,22 @@ class TrayApplication:
         """
         try:
             copy_text(uid)
-            self.notifier.uid_copied(uid)
+            self.notifier.show_uid_toast(uid, from_history=True)
         except Exception as exc:
             safe_log(f"[App] Failed to copy UID from menu: {exc}")
 
     def _on_click_exit(self, icon=None, item=None) -> None:
         self._stop_event.set()
+        self._ui_wake.set()  # let the UI pump observe the stop event
+        if self._scard_ctx is not None:
+            try:
+                SCardCancel(self._scard_ctx)  # unblock SCardGetStatusChange
+            except Exception:
+                pass
         try:
-            self._ensure_card_monitor_stopped()
+            self._shutdown_card_monitor()
+            self.notifier.shutdown()
+            self._clip_pool.shutdown(wait=False)
         finally:
             try:
                 self.icon.visible = False
@@ -3,23 +3,24 @@ Card observer that reads the UID upon insertion.
 """
 from __future__ import annotations
 
+import os
+import queue
+import threading
 import time
-import traceback
 from typing import Callable
 
 from smartcard.CardMonitoring import CardObserver
 from smartcard.Exceptions import CardConnectionException
-from smartcard.util import toHexString
 
 from .commands import GET_UID_COMMAND
 from app.utils.logging import safe_log
 
+# Full tracebacks are expensive to format (stack walk plus source reads)
+# and the connect/read error path fires on every card-removal race.
+_DEBUG = os.getenv("NFCOPY_DEBUG") == "1"
 
-def _coerce_card(item):
-    """Return a ``Card`` instance from a variety of pyscard callback shapes."""
-    if isinstance(item, tuple) and len(item) >= 1:
-        return item[0]
-    return item
+# Sentinel that tells the card worker to exit.
+_STOP = object()
 
 
 class UIDObserver(CardObserver):
@@ -28,35 +29,86 @@ class UIDObserver(CardObserver):
     def __init__(self, on_uid: Callable[[str], None]):
         super().__init__()
         self._on_uid = on_uid
+        # One long-lived connection per reader; reconnecting on every tap
+        # costs a full SCardConnect/SCardDisconnect round-trip.
+        self._connections: dict = {}
+        # Card I/O runs on this worker so pyscard's monitor thread never
+        # blocks inside the observer callback; taps serialize in order.
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._work_loop, name="CardReader", daemon=True
+        )
+        self._worker.start()
 
     # pyscard interface -------------------------------------------------
     def update(self, observable, actions):
         added_cards, _removed = actions
         for raw in added_cards:
-            card = _coerce_card(raw)
-            self._read_uid(card)
+            # pyscard normally passes Card instances; tuples only appear
+            # from older callback shapes.
+            self._queue.put_nowait(raw[0] if type(raw) is tuple else raw)
+
+    def close(self) -> None:
+        """Stop the card worker and disconnect cached reader connections."""
+        self._queue.put_nowait(_STOP)
+        connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
 
     # internals ---------------------------------------------------------
-    def _read_uid(self, card) -> None:
-        try:
-            conn = card.createConnection()
+    def _work_loop(self) -> None:
+        while True:
+            card = self._queue.get()
+            if card is _STOP:
+                return
+            self._read_uid(card)
+
+    def _transmit_uid(self, card):
+        """Transmit GET UID, reusing the cached connection when possible."""
+        reader = getattr(card, "reader", None)
+        conn = self._connections.get(reader)
+        if conn is not None:
+            try:
+                return conn.transmit(GET_UID_COMMAND)
+            except Exception:
+                # Stale connection (card changed/removed); rebuild below.
+                self._connections.pop(reader, None)
+
+        conn = card.createConnection()
+        for delay in (0.02, 0.04, 0.08):
             try:
                 conn.connect()
+                break
             except CardConnectionException:
-                time.sleep(0.2)
-                conn.connect()
+                # Sharing violations and removal races clear quickly;
+                # back off briefly instead of a blind 200ms sleep.
+                time.sleep(delay)
+        else:
+            conn.connect()  # last attempt; let the exception propagate
+        result = conn.transmit(GET_UID_COMMAND)
+        self._connections[reader] = conn
+        return result
 
-            data, sw1, sw2 = conn.transmit(GET_UID_COMMAND)
+    def _read_uid(self, card) -> None:
+        try:
+            data, sw1, sw2 = self._transmit_uid(card)
             if (sw1, sw2) == (0x90, 0x00) and data:
                 # Heuristic for ACR122U 4B MIFARE: sometimes returns 7 bytes
                 if len(data) > 4:
-                    uid_bytes = [0x88] + data[:3]  # prepend cascade tag
+                    uid_bytes = b"\x88" + bytes(data[:3])  # prepend cascade tag
                 else:
-                    uid_bytes = data
+                    uid_bytes = bytes(data)
 
-                uid_hex = toHexString(uid_bytes).replace(" ", "").upper()
+                uid_hex = uid_bytes.hex().upper()
                 self._on_uid(uid_hex)
             else:
                 safe_log(f"[UIDObserver] Unexpected SW1/SW2: {sw1:02X} {sw2:02X}")
         except Exception as exc:
-            safe_log(f"[UIDObserver] Exception while reading card: {exc}\n{traceback.format_exc()}")
+            if _DEBUG:
+                import traceback
+                safe_log(f"[UIDObserver] Exception while reading card: {exc}\n{traceback.format_exc()}")
+            else:
+                safe_log(f"[UIDObserver] {type(exc).__name__}: {exc}")
@@ -1,24 +1,78 @@
 """
 Runtime-generated system tray icons (no external image files required).
+
+Icons are deterministic for a given size, so they are memoized in-process
+and persisted as PNGs under ``%LOCALAPPDATA%/NFCopy/icons`` — a later
+startup reads the bytes back instead of rasterizing again.
 """
 from __future__ import annotations
 
+import functools
+import os
+from pathlib import Path
+from typing import Optional
+
 from PIL import Image, ImageDraw
 
+_CACHE_DIRNAME = "NFCopy"
+
+
+def _icon_cache_dir() -> Optional[Path]:
+    try:
+        base = Path(os.getenv("LOCALAPPDATA", Path.cwd())) / _CACHE_DIRNAME / "icons"
+        base.mkdir(parents=True, exist_ok=True)
+        return base
+    except Exception:
+        return None
+
+
+def _load_cached(name: str, size: int) -> Optional[Image.Image]:
+    cache_dir = _icon_cache_dir()
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{name}-{size}.png"
+    if not path.is_file():
+        return None
+    try:
+        img = Image.open(path)
+        img.load()
+        return img
+    except Exception:
+        return None
+
+
+def _store_cached(name: str, size: int, img: Image.Image) -> None:
+    cache_dir = _icon_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        img.save(cache_dir / f"{name}-{size}.png", "PNG", optimize=True)
+    except Exception:
+        pass
+
 
+@functools.lru_cache(maxsize=4)
 def draw_icon_connected(size: int = 64) -> Image.Image:
     """Create a green checkmark-in-circle icon."""
+    cached = _load_cached("connected", size)
+    if cached is not None:
+        return cached
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     d = ImageDraw.Draw(img)
     margin = 4
     d.ellipse((margin, margin, size - margin, size - margin),
               fill=(230, 255, 230, 255), outline=(0, 140, 0, 255), width=3)
     d.line([(18, 34), (28, 44), (48, 22)], fill=(0, 140, 0, 255), width=8)
+    _store_cached("connected", size, img)
     return img
 
 
+@functools.lru_cache(maxsize=4)
 def draw_icon_disconnected(size: int = 64) -> Image.Image:
     """Create a red cross-in-circle icon."""
+    cached = _load_cached("disconnected", size)
+    if cached is not None:
+        return cached
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     d = ImageDraw.Draw(img)
     margin = 4
@@ -26,4 +80,5 @@ def draw_icon_disconnected(size: int = 64) -> Image.Image:
               fill=(255, 230, 230, 255), outline=(170, 0, 0, 255), width=3)
     d.line([(20, 20), (44, 44)], fill=(170, 0, 0, 255), width=8)
     d.line([(44, 20), (20, 44)], fill=(170, 0, 0, 255), width=8)
+    _store_cached("disconnected", size, img)
     return img
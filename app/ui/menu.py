@@ -3,17 +3,40 @@ System tray menu construction.
 """
 from __future__ import annotations
 
-from typing import Callable, Iterable, List
-from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, List, Optional
 
 import pystray
-from pystray import MenuItem, Menu
+from pystray import MenuItem
 
 from version import APP_NAME, VERSION
 
 CopyHandler = Callable[[str], None]
 ExitHandler = Callable[[], None]
 
+# History is capped at 10 entries, so the per-entry callbacks are created
+# once at import time; each rebuild only mutates the shared UID list in
+# place instead of allocating a fresh partial per item.
+_HISTORY_SLOTS = 10
+_SLOT_UIDS: List[str] = [""] * _HISTORY_SLOTS
+_copy_handler: Optional[CopyHandler] = None
+
+
+def _dispatch_slot(index: int) -> None:
+    handler = _copy_handler
+    uid = _SLOT_UIDS[index]
+    if handler is not None and uid:
+        handler(uid)
+
+
+_slots = tuple(
+    (lambda icon=None, item=None, _i=i: _dispatch_slot(_i))
+    for i in range(_HISTORY_SLOTS)
+)
+
+# Index labels are always "(1) ".."(10) "; format them once.
+_PREFIXES = tuple(f"({i}) " for i in range(1, _HISTORY_SLOTS + 1))
+
 
 def _application_title_item() -> MenuItem:
     return MenuItem(f"{APP_NAME} v{VERSION}\n", None, enabled=False)
@@ -25,41 +48,52 @@ def _empty_history_item() -> MenuItem:
     return MenuItem("— vazio —", None, enabled=False)
 
 
-def build_menu(reader_status: str,
-               history: Iterable[str],
-               on_copy_uid: CopyHandler,
-               on_exit: ExitHandler) -> Menu:
+def iter_menu_items(reader_status: str,
+                    history: Iterable[str],
+                    on_copy_uid: CopyHandler,
+                    on_exit: ExitHandler) -> Iterable[MenuItem]:
     """
-    Build and return the system tray menu.
+    Yield the system tray menu items.
+
+    Intended as the source of a dynamic ``pystray.Menu``: items are only
+    regenerated when the menu is actually (re)shown, so no ``Menu`` object
+    is reconstructed per update.
 
     Parameters
     ----------
     reader_status: str
         Human-readable reader connection status.
     history: Iterable[str]
-        UID values from oldest to newest.
+        UID values from oldest to newest (at most 10).
     on_copy_uid: Callable[[str], None]
-        Callback to copy a chosen UID again. Must accept (uid, *_) so we can partial-bind.
+        Callback to copy a chosen UID again.
     on_exit: Callable[[], None]
         Callback to terminate the application.
     """
-    items: List[MenuItem] = [
-        _application_title_item(),
-        MenuItem(reader_status, None, enabled=False),
-        pystray.Menu.SEPARATOR,
-        _history_header_item()
-    ]
-
-    entries = list(history)  # oldest → newest (matches original)
-    if not entries:
-        items.append(_empty_history_item())
-    else:
-        for idx, uid in enumerate(entries, start=1):
-            label = f"({idx}) {uid}"
-            # Use partial so pystray can still pass (icon, item) afterwards
-            items.append(MenuItem(label, partial(on_copy_uid, uid)))
+    global _copy_handler
+    _copy_handler = on_copy_uid
 
-    items.append(pystray.Menu.SEPARATOR)
-    items.append(MenuItem("Encerrar", lambda icon, item: on_exit()))
+    yield _application_title_item()
+    yield MenuItem(reader_status, None, enabled=False)
+    yield pystray.Menu.SEPARATOR
+    yield _history_header_item()
+
+    # Single pass over the iterable (oldest → newest), no intermediate list.
+    it = iter(history)
+    try:
+        first = next(it)
+    except StopIteration:
+        yield _empty_history_item()
+    else:
+        _SLOT_UIDS[0] = first
+        yield MenuItem(_PREFIXES[0] + first, _slots[0])
+        idx = 0
+        # Never read past the slot tables, even if the caller races the
+        # history past its nominal cap.
+        for uid in islice(it, _HISTORY_SLOTS - 1):
+            idx += 1
+            _SLOT_UIDS[idx] = uid
+            yield MenuItem(_PREFIXES[idx] + uid, _slots[idx])
 
-    return Menu(*items)
+    yield pystray.Menu.SEPARATOR
+    yield MenuItem("Encerrar", lambda icon, item: on_exit())
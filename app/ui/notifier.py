@@ -4,41 +4,80 @@ User notifications for new UIDs via Windows toast or tray balloon.
 from __future__ import annotations
 
 import sys
-
-import pystray
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 from app.utils.logging import safe_log
 
+BalloonNotify = Callable[[str, str], None]
+
+# Shared ToastNotifier: constructing one registers a hidden Win32 window
+# class, so it is created lazily on first use and reused afterwards.
+_toaster_singleton = None
+_toaster_failed = False
+
+
+def _get_toaster():
+    """Return the shared ToastNotifier, or ``None`` when unavailable."""
+    global _toaster_singleton, _toaster_failed
+    if _toaster_singleton is None and not _toaster_failed:
+        if getattr(sys, "frozen", False):
+            _toaster_failed = True
+            return None
+        try:
+            from win10toast_persist import ToastNotifier
+            _toaster_singleton = ToastNotifier()
+        except Exception as exc:
+            _toaster_failed = True
+            safe_log(f"[Notifier] Toast disabled: {exc}")
+    return _toaster_singleton
+
 
 class Notifier:
     """
     Show user notifications when a UID is captured.
 
     In development (non-frozen), uses Windows 10+ Action Center toasts.
-    In frozen executables, falls back to the tray icon's balloon tooltip.
+    In frozen executables, falls back to the ``balloon_notify`` callable
+    (typically the tray icon's balloon tooltip).
     """
 
-    def __init__(self, tray_icon: pystray.Icon) -> None:
-        self._toaster = None
-        self._tray_icon = tray_icon
-        if not getattr(sys, "frozen", False):
-            try:
-                from win10toast_persist import ToastNotifier
-                self._toaster = ToastNotifier()
-            except Exception as exc:
-                safe_log(f"[Notifier] Toast disabled: {exc}")
+    def __init__(self, balloon_notify: BalloonNotify) -> None:
+        self._balloon_notify = balloon_notify
+        # One reusable worker instead of a fresh thread per toast; the
+        # bounded deque drops the oldest toasts when state flaps rapidly.
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Toast")
+        self._pending: deque = deque(maxlen=4)
+
+    def shutdown(self) -> None:
+        """Stop the toast worker; pending toasts are abandoned."""
+        self._pool.shutdown(wait=False)
 
     def _show_notification(self, title, body) -> None:
+        self._pending.append((title, body))
         try:
-            if self._toaster is not None:
-                self._toaster.show_toast(title, body, duration=3, threaded=True, icon_path=None)
-            else:
-                self._tray_icon.notify(body, title=title)
-        except Exception as exc:
-            safe_log(f"[Notifier] Notification failed; trying balloon: {exc}")
+            self._pool.submit(self._drain_notifications)
+        except RuntimeError:
+            pass  # already shut down
+
+    def _drain_notifications(self) -> None:
+        while True:
+            try:
+                title, body = self._pending.popleft()
+            except IndexError:
+                return
+            try:
+                toaster = _get_toaster()
+                if toaster is not None:
+                    toaster.show_toast(title, body, duration=3, threaded=False, icon_path=None)
+                else:
+                    self._balloon_notify(body, title)
+            except Exception as exc:
+                safe_log(f"[Notifier] Notification failed: {exc}")
 
 
-    def uid_copied(self, uid: str, from_history=False) -> None:
+    def show_uid_toast(self, uid: str, from_history=False) -> None:
         """Notify the user that ``uid`` was read and copied to clipboard."""
         title = (
             "UID lido com sucesso:"
@@ -53,7 +92,7 @@ class Notifier:
         )
         self._show_notification(title, body)
 
-    def nfc_reader_state(self, reader_name: str, reader_last_name: str, connected: bool) -> None:
+    def show_nfc_reader_state_toast(self, reader_name: str, reader_last_name: str, connected: bool) -> None:
         """Notify the user that ``reader_name`` was connected or disconnected."""
         state = ("conectado" if connected else "desconectado")
         name = (reader_name if connected else reader_last_name)
@@ -64,4 +103,4 @@ class Notifier:
             if name else
             f"Conecte um leitor NFC para começar."
         )
-        self._show_notification(title, body)
\ No newline at end of file
+        self._show_notification(title, body)
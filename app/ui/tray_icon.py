@@ -0,0 +1,96 @@
+"""
+Win32-aware tray icon that can swap pre-built HICON handles.
+
+pystray re-serializes the PIL image and calls ``LoadImage`` every time
+``icon.icon`` is assigned. Since our two state icons are static, we load
+each of them once as a native ``HICON`` and swap the handle directly,
+skipping the per-switch serialization round-trip.
+"""
+from __future__ import annotations
+
+import ctypes
+import os
+import sys
+import tempfile
+from typing import Optional
+
+import pystray
+
+from app.utils.logging import safe_log
+
+_IMAGE_ICON = 1
+_LR_LOADFROMFILE = 0x0010
+_LR_DEFAULTSIZE = 0x0040
+
+
+def load_hicon(image) -> Optional[int]:
+    """Serialize ``image`` once to a temporary .ico and load it as an HICON.
+
+    Returns ``None`` when not on Windows or when loading fails; callers
+    fall back to plain ``icon.icon`` assignment in that case.
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        fd, path = tempfile.mkstemp(suffix=".ico")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                image.save(fh, "ICO")
+            handle = ctypes.windll.user32.LoadImageW(
+                None, path, _IMAGE_ICON, 0, 0, _LR_LOADFROMFILE | _LR_DEFAULTSIZE
+            )
+            return handle or None
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    except Exception as exc:
+        safe_log(f"[TrayIcon] Failed to pre-load HICON: {exc}")
+        return None
+
+
+if sys.platform == "win32":
+    from pystray._win32 import Icon as _BaseIcon
+
+    class TrayIcon(_BaseIcon):
+        """pystray icon that reuses pre-built HICON handles across updates."""
+
+        def __init__(self, *args, **kwargs) -> None:
+            self._next_handle: Optional[int] = None
+            self._protected_handles: set = set()
+            super().__init__(*args, **kwargs)
+
+        def set_icon_handle(self, hicon: int) -> None:
+            """Display ``hicon`` via NIM_MODIFY without re-serializing."""
+            self._protected_handles.add(hicon)
+            self._next_handle = hicon
+            self._update_icon()
+
+        @property
+        def icon(self):
+            return _BaseIcon.icon.fget(self)
+
+        @icon.setter
+        def icon(self, value) -> None:
+            # A plain image assignment must serialize that image; drop any
+            # pending handle override so it isn't re-attached instead.
+            self._next_handle = None
+            _BaseIcon.icon.fset(self, value)
+
+        # pystray internals --------------------------------------------------
+        def _assert_icon_handle(self) -> None:
+            if self._icon_handle is None and self._next_handle is not None:
+                self._icon_handle = self._next_handle
+                return
+            super()._assert_icon_handle()
+
+        def _release_icon(self) -> None:
+            # Never destroy a cached handle; just detach it so the next
+            # update re-attaches it (or serializes a new icon if asked).
+            if self._icon_handle in self._protected_handles:
+                self._icon_handle = None
+                return
+            super()._release_icon()
+else:  # pragma: no cover - non-Windows fallback
+    TrayIcon = pystray.Icon
@@ -1,17 +1,88 @@
 """Clipboard helpers with safe logging on failure."""
 from __future__ import annotations
 
-import pyperclip
+import sys
+import time
 
 from .logging import safe_log
 
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+
+def _copy_text_win32(text: str) -> None:
+    """Set ``text`` as CF_UNICODETEXT via direct Win32 clipboard calls."""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+
+    # Declare signatures explicitly: ctypes defaults to c_int, which
+    # truncates HGLOBAL handles and pointers on 64-bit Python.
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.argtypes = []
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.CloseClipboard.argtypes = []
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+
+    # Another process may hold the clipboard for a moment; retry briefly.
+    for _ in range(5):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(0.01)
+    else:
+        raise OSError("OpenClipboard failed")
+
+    try:
+        user32.EmptyClipboard()
+        data = text.encode("utf-16-le") + b"\x00\x00"
+        handle = kernel32.GlobalAlloc(_GMEM_MOVEABLE, len(data))
+        if not handle:
+            raise OSError("GlobalAlloc failed")
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            kernel32.GlobalFree(handle)
+            raise OSError("GlobalLock failed")
+        try:
+            ctypes.memmove(ptr, data, len(data))
+        finally:
+            kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(_CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            raise OSError("SetClipboardData failed")
+        # Ownership of the memory passed to the clipboard on success.
+    finally:
+        user32.CloseClipboard()
+
 
 def copy_text(text: str) -> None:
     """Copy ``text`` to the system clipboard.
 
+    On Windows this talks to the clipboard API directly — pyperclip's
+    path can spawn a helper process per copy. pyperclip remains the
+    fallback elsewhere or if the Win32 path fails.
     Any failure is logged and ignored to avoid breaking UX.
     """
+    if sys.platform == "win32":
+        try:
+            _copy_text_win32(text)
+            return
+        except Exception as exc:
+            safe_log(f"[clipboard] Win32 copy failed, falling back: {exc}")
     try:
+        import pyperclip
         pyperclip.copy(text)
     except Exception as exc:
         safe_log(f"[clipboard] Failed to copy text: {exc}")
@@ -6,14 +6,21 @@ with a safe fallback to the current working directory.
 """
 from __future__ import annotations
 
+import atexit
+import functools
 import os
+import threading
 from pathlib import Path
-from typing import Final
+from typing import Final, Optional, TextIO
 
 _LOG_DIRNAME: Final[str] = "NFCopy"
 _LOG_FILENAME: Final[str] = "NFCopy.log"
 
+_LOG_FH: Optional[TextIO] = None
+_LOG_LOCK = threading.Lock()
 
+
+@functools.lru_cache(maxsize=1)
 def log_path() -> Path:
     """Return the path where the log file should be written."""
     base = Path(os.getenv("LOCALAPPDATA", Path.cwd())) / _LOG_DIRNAME
@@ -24,18 +31,35 @@ def log_path() -> Path:
     return base / _LOG_FILENAME
 
 
+def _close_log_file() -> None:
+    global _LOG_FH
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.close()
+            except Exception:
+                pass
+            _LOG_FH = None
+
+
 def safe_log(message: str) -> None:
     """Append ``message`` to the log file, swallowing any error.
 
+    The file is opened once (line-buffered, append mode) and kept open, so
+    each call costs a single buffered write instead of open/write/close.
+
     Parameters
     ----------
     message: str
         The message to write (a trailing newline is added if missing).
     """
+    global _LOG_FH
     try:
-        p = log_path()
-        with p.open("a", encoding="utf-8") as fh:
-            fh.write(message.rstrip() + "\n")
+        with _LOG_LOCK:
+            if _LOG_FH is None:
+                _LOG_FH = log_path().open("a", encoding="utf-8", buffering=1)
+                atexit.register(_close_log_file)
+            _LOG_FH.write(message.rstrip() + "\n")
     except Exception:
         # Intentionally ignore logging errors.
         pass